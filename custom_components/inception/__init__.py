@@ -7,14 +7,18 @@ https://github.com/sebr/inception-home-assistant
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import suppress
 from typing import TYPE_CHECKING
 
 from homeassistant.const import Platform
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.storage import Store
+from homeassistant.loader import async_get_loaded_integration
 
 from .const import DOMAIN
 from .coordinator import InceptionUpdateCoordinator
+from .data import InceptionEntryData
 from .entity import panel_device_info
 
 if TYPE_CHECKING:
@@ -22,7 +26,7 @@ if TYPE_CHECKING:
 
     from .data import InceptionConfigEntry
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.ALARM_CONTROL_PANEL,
     Platform.BINARY_SENSOR,
     Platform.LOCK,
@@ -30,7 +34,7 @@ PLATFORMS: list[Platform] = [
     Platform.SELECT,
     Platform.SENSOR,
     Platform.SWITCH,
-]
+)
 
 
 async def async_setup_entry(
@@ -42,9 +46,27 @@ async def async_setup_entry(
         hass=hass,
         entry=entry,
     )
-    await coordinator.async_config_entry_first_refresh()
-
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    # Platform modules are imported in the executor; start that alongside the
+    # first refresh instead of waiting for the controller to respond first.
+    # Forwarding itself still has to wait, as the platforms need the data.
+    integration = async_get_loaded_integration(hass, entry.domain)
+    import_platforms = asyncio.create_task(integration.async_get_platforms(PLATFORMS))
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Don't leave the import running unawaited; the refresh error is the
+        # one to report. The import futures are shared with other callers in
+        # the loader, so let it finish rather than cancelling it.
+        with suppress(Exception):
+            await import_platforms
+        raise
+    await import_platforms
+
+    entry.runtime_data = InceptionEntryData(
+        client=coordinator.api,
+        coordinator=coordinator,
+        integration=integration,
+    )
 
     # Register the controller as a device up front so child devices that
     # reference it via `via_device` always have a parent to attach to.
@@ -69,12 +91,9 @@ async def async_unload_entry(
     if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         return False
 
-    # Clean up the coordinator
-    coordinator: InceptionUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    await coordinator.async_unload()
-
-    # Remove the coordinator from hass.data
-    hass.data[DOMAIN].pop(entry.entry_id)
+    # Stop the coordinator. The close is shielded so a cancelled unload
+    # still tears down the long-poll task.
+    await asyncio.shield(entry.runtime_data.coordinator.async_unload())
 
     return True
 
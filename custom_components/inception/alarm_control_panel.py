@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from functools import cache, reduce
+from operator import or_
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant.components.alarm_control_panel import (
@@ -23,12 +25,13 @@ from .const import (
     CONF_REQUIRE_PIN_CODE,
     DEFAULT_REQUIRE_CODE_TO_ARM,
     DEFAULT_REQUIRE_PIN_CODE,
-    DOMAIN,
 )
 from .entity import InceptionEntity
 from .pyinception.schemas.area import AreaPublicState
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -37,6 +40,89 @@ if TYPE_CHECKING:
     from .pyinception.schemas.area import AreaSummaryEntry
 
 SERVICE_AREA_ARM = "area_arm"
+AREA_ARM_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional("exit_delay"): cv.boolean,
+        vol.Optional("seal_check"): cv.boolean,
+        vol.Optional("code"): cv.string,
+    }
+)
+
+# Ordered (area state mask, alarm state) pairs; the first matching flag wins.
+# Masks are plain ints: public states arrive as ints, and int & IntFlag would
+# dispatch to IntFlag.__rand__ and build a flag instance on every test.
+_STATE_MAPPINGS: tuple[tuple[int, AlarmControlPanelState], ...] = tuple(
+    (int(area_state), alarm_state)
+    for area_state, alarm_state in (
+        # 1. Triggered
+        (AreaPublicState.ALARM, AlarmControlPanelState.TRIGGERED),
+        # 2. Pending
+        (AreaPublicState.ENTRY_DELAY, AlarmControlPanelState.PENDING),
+        (AreaPublicState.EXIT_DELAY, AlarmControlPanelState.PENDING),
+        # 3. Arming
+        (AreaPublicState.ARM_WARNING, AlarmControlPanelState.ARMING),
+        # 4. Armed (Perimiter)
+        (AreaPublicState.STAY_ARM, AlarmControlPanelState.ARMED_HOME),
+        # 5. Armed (Sleep)
+        (AreaPublicState.SLEEP_ARM, AlarmControlPanelState.ARMED_NIGHT),
+        # 6. Armed (Full)
+        (AreaPublicState.AWAY_ARM, AlarmControlPanelState.ARMED_AWAY),
+        (AreaPublicState.ARMED, AlarmControlPanelState.ARMED_AWAY),
+        # 7. Disarmed
+        (AreaPublicState.DISARMED, AlarmControlPanelState.DISARMED),
+    )
+)
+
+# Only the flags above influence the alarm state; masking the rest keeps the
+# resolved-state cache bounded while other bits (e.g. ARM_READY) churn.
+_STATE_MASK = int(reduce(or_, (area_state for area_state, _ in _STATE_MAPPINGS)))
+
+# Request bodies for the plain arm/disarm calls, built once at import.
+_CONTROL_PAYLOADS: dict[str, dict[str, str]] = {
+    control_type: {"Type": "ControlArea", "AreaControlType": control_type}
+    for control_type in ("Arm", "ArmStay", "ArmSleep", "Disarm")
+}
+# The API expects lowercase boolean strings; indexed by the bool itself.
+_BOOL_STR = ("false", "true")
+
+_BASE_FEATURES = (
+    AlarmControlPanelEntityFeature.ARM_AWAY | AlarmControlPanelEntityFeature.TRIGGER
+)
+_MULTI_MODE_FEATURES = (
+    _BASE_FEATURES
+    | AlarmControlPanelEntityFeature.ARM_HOME
+    | AlarmControlPanelEntityFeature.ARM_NIGHT
+)
+
+
+def _resolve_code_options(
+    options: Mapping[str, Any],
+) -> tuple[CodeFormat | None, bool]:
+    """Return the (code format, code arm required) pair for the entry options."""
+    require_pin = options.get(CONF_REQUIRE_PIN_CODE, DEFAULT_REQUIRE_PIN_CODE)
+    require_code_to_arm = options.get(
+        CONF_REQUIRE_CODE_TO_ARM, DEFAULT_REQUIRE_CODE_TO_ARM
+    )
+
+    # If PIN entry is disabled, do not require a code to arm to avoid
+    # an inconsistent configuration where the UI cannot supply a code.
+    if not require_pin:
+        return None, False
+
+    return CodeFormat.NUMBER, require_code_to_arm
+
+
+@cache
+def _resolve_alarm_state(public_state: int) -> AlarmControlPanelState | None:
+    """Resolve the highest-priority alarm state for a masked public state."""
+    return next(
+        (
+            alarm_state
+            for area_state, alarm_state in _STATE_MAPPINGS
+            if public_state & area_state
+        ),
+        None,
+    )
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -45,14 +131,15 @@ class InceptionAlarmDescription(AlarmControlPanelEntityDescription):
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    _hass: HomeAssistant,
     entry: InceptionConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the alarm platform."""
-    coordinator: InceptionUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data.coordinator
+    code_options = _resolve_code_options(coordinator.config_entry.options)
 
-    entities: list[InceptionAlarm] = [
+    async_add_entities(
         InceptionAlarm(
             coordinator=coordinator,
             entity_description=InceptionAlarmDescription(
@@ -60,22 +147,15 @@ async def async_setup_entry(
                 name=area.entity_info.name,
             ),
             data=area,
+            code_options=code_options,
         )
         for area in coordinator.data.areas.get_items()
-    ]
-
-    async_add_entities(entities)
+    )
 
     platform = entity_platform.async_get_current_platform()
 
     platform.async_register_entity_service(
-        SERVICE_AREA_ARM,
-        {
-            vol.Optional("exit_delay"): cv.boolean,
-            vol.Optional("seal_check"): cv.boolean,
-            vol.Optional("code"): cv.string,
-        },
-        "area_arm_service",
+        SERVICE_AREA_ARM, AREA_ARM_SCHEMA, "area_arm_service"
     )
 
 
@@ -90,6 +170,8 @@ class InceptionAlarm(InceptionEntity, AlarmControlPanelEntity):
         coordinator: InceptionUpdateCoordinator,
         entity_description: InceptionAlarmDescription,
         data: AreaSummaryEntry,
+        *,
+        code_options: tuple[CodeFormat | None, bool] | None = None,
     ) -> None:
         """Initialize the alarm class."""
         super().__init__(
@@ -97,61 +179,25 @@ class InceptionAlarm(InceptionEntity, AlarmControlPanelEntity):
         )
         self.data = data
         self.entity_description = entity_description
+        self._control_path = f"/control/area/{data.entity_info.id}/activity"
 
-        options = coordinator.config_entry.options
-        require_pin = options.get(CONF_REQUIRE_PIN_CODE, DEFAULT_REQUIRE_PIN_CODE)
-        require_code_to_arm = options.get(
-            CONF_REQUIRE_CODE_TO_ARM, DEFAULT_REQUIRE_CODE_TO_ARM
-        )
-
-        # If PIN entry is disabled, do not require a code to arm to avoid
-        # an inconsistent configuration where the UI cannot supply a code.
-        if not require_pin:
-            require_code_to_arm = False
-
-        self._attr_code_format = CodeFormat.NUMBER if require_pin else None
-        self._attr_code_arm_required = require_code_to_arm
+        if code_options is None:
+            code_options = _resolve_code_options(coordinator.config_entry.options)
+        self._attr_code_format, self._attr_code_arm_required = code_options
         self._attr_supported_features = (
-            AlarmControlPanelEntityFeature.ARM_AWAY
-            | AlarmControlPanelEntityFeature.TRIGGER
+            _MULTI_MODE_FEATURES
+            if data.arm_info.multi_mode_arm_enabled
+            else _BASE_FEATURES
         )
-        if data.arm_info.multi_mode_arm_enabled:
-            self._attr_supported_features |= (
-                AlarmControlPanelEntityFeature.ARM_HOME
-                | AlarmControlPanelEntityFeature.ARM_NIGHT
-            )
-
-    @property
-    def alarm_state(self) -> AlarmControlPanelState | None:
-        """Return the state of the alarm."""
-        if self.data.public_state is None:
-            return None
-
-        state_mappings = {
-            # Order here matters:
-            # 1. Triggered
-            AreaPublicState.ALARM: AlarmControlPanelState.TRIGGERED,
-            # 2. Pending
-            AreaPublicState.ENTRY_DELAY: AlarmControlPanelState.PENDING,
-            AreaPublicState.EXIT_DELAY: AlarmControlPanelState.PENDING,
-            # 3. Arming
-            AreaPublicState.ARM_WARNING: AlarmControlPanelState.ARMING,
-            # 4. Armed (Perimiter)
-            AreaPublicState.STAY_ARM: AlarmControlPanelState.ARMED_HOME,
-            # 5. Armed (Sleep)
-            AreaPublicState.SLEEP_ARM: AlarmControlPanelState.ARMED_NIGHT,
-            # 6. Armed (Full)
-            AreaPublicState.AWAY_ARM: AlarmControlPanelState.ARMED_AWAY,
-            AreaPublicState.ARMED: AlarmControlPanelState.ARMED_AWAY,
-            # 7. Disarmed
-            AreaPublicState.DISARMED: AlarmControlPanelState.DISARMED,
-        }
 
-        for area_state, alarm_state in state_mappings.items():
-            if bool(self.data.public_state & area_state):
-                return alarm_state
-
-        return None
+    def _update_attrs(self) -> None:
+        """Resolve the alarm state once per coordinator update."""
+        public_state = self._inception_object.public_state
+        self._attr_alarm_state = (
+            None
+            if public_state is None
+            else _resolve_alarm_state(public_state & _STATE_MASK)
+        )
 
     async def _alarm_control(
         self,
@@ -162,24 +208,28 @@ class InceptionAlarm(InceptionEntity, AlarmControlPanelEntity):
         seal_check: bool | None = None,
     ) -> None:
         """Control the switch."""
-        data = {
+        data = _CONTROL_PAYLOADS.get(control_type) or {
             "Type": "ControlArea",
             "AreaControlType": control_type,
         }
 
+        # The shared payloads are only sent as-is; copy before adding options.
+        if code or exit_delay is not None or seal_check is not None:
+            data = dict(data)
+
         if code:
             data["ExecuteAsOtherUser"] = "true"
             data["OtherUserPIN"] = code
 
         # Only add optional parameters if explicitly provided
         if exit_delay is not None:
-            data["ExitDelay"] = str(exit_delay).lower()
+            data["ExitDelay"] = _BOOL_STR[exit_delay]
         if seal_check is not None:
-            data["SealCheck"] = str(seal_check).lower()
+            data["SealCheck"] = _BOOL_STR[seal_check]
 
         return await self.coordinator.api.request(
             method="post",
-            path=f"/control/area/{self.data.entity_info.id}/activity",
+            path=self._control_path,
             data=data,
         )
 
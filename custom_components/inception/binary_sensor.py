@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -17,10 +17,10 @@ from .const import DOMAIN, MANUFACTURER
 from .entity import InceptionEntity, panel_identifiers
 from .pyinception.schemas.door import DoorPublicState
 from .pyinception.schemas.input import InputPublicState
-from .util import find_matching_door
+from .util import index_doors_by_name, match_door
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -42,6 +42,95 @@ class InceptionBinarySensorDescription(BinarySensorEntityDescription):
     value_fn: Callable[[InceptionSummaryEntry], bool]
 
 
+# Ordered (keyword, device_class) pairs for get_device_class_for_name.
+# More specific patterns first to avoid false positives, e.g. "garage door"
+# must match before "door".
+_DEVICE_CLASS_PATTERNS: tuple[tuple[str, BinarySensorDeviceClass], ...] = (
+    # Specific door types (must come before generic "door")
+    ("side door", BinarySensorDeviceClass.DOOR),
+    ("hallway door", BinarySensorDeviceClass.DOOR),
+    ("garage door", BinarySensorDeviceClass.GARAGE_DOOR),
+    ("garage", BinarySensorDeviceClass.GARAGE_DOOR),
+    # Motion and presence detection
+    ("pe beam", BinarySensorDeviceClass.MOTION),
+    ("pir", BinarySensorDeviceClass.MOTION),
+    ("motion", BinarySensorDeviceClass.MOTION),
+    ("beam", BinarySensorDeviceClass.MOTION),
+    # Safety and security
+    ("duress", BinarySensorDeviceClass.SAFETY),
+    ("panic", BinarySensorDeviceClass.SAFETY),
+    ("tamper", BinarySensorDeviceClass.TAMPER),
+    # Glass and window detection
+    ("glass break", BinarySensorDeviceClass.TAMPER),
+    ("glass", BinarySensorDeviceClass.WINDOW),
+    ("louvre", BinarySensorDeviceClass.WINDOW),
+    ("window", BinarySensorDeviceClass.WINDOW),
+    # Environmental sensors
+    ("smoke", BinarySensorDeviceClass.SMOKE),
+    ("gas", BinarySensorDeviceClass.GAS),
+    ("heat", BinarySensorDeviceClass.HEAT),
+    ("cold", BinarySensorDeviceClass.COLD),
+    ("moisture", BinarySensorDeviceClass.MOISTURE),
+    # Vibration and shock
+    ("shock", BinarySensorDeviceClass.TAMPER),
+    ("vibration", BinarySensorDeviceClass.TAMPER),
+    ("break", BinarySensorDeviceClass.TAMPER),
+    # Access control
+    ("rex", BinarySensorDeviceClass.CONNECTIVITY),
+    ("ren", BinarySensorDeviceClass.CONNECTIVITY),
+    ("exit", BinarySensorDeviceClass.CONNECTIVITY),
+    ("entry", BinarySensorDeviceClass.CONNECTIVITY),
+    ("button", BinarySensorDeviceClass.CONNECTIVITY),
+    # Generic types
+    ("contact", BinarySensorDeviceClass.OPENING),
+    ("door", BinarySensorDeviceClass.DOOR),
+    ("gate", BinarySensorDeviceClass.DOOR),
+    ("opening", BinarySensorDeviceClass.OPENING),
+    ("power", BinarySensorDeviceClass.POWER),
+    ("light", BinarySensorDeviceClass.LIGHT),
+)
+
+# Door-input suffixes already covered by the door's own binary sensors, in
+# the lowercase, single-spaced form produced by _normalize_suffix.
+_STANDARD_DOOR_SUFFIXES = frozenset(
+    {
+        "forced",
+        "held open",
+        "held open too long",
+        "dotl",
+        "open",
+        "sensor",
+        "contact",
+        "reed",
+        "reed contact",
+        "reed sensor",
+        "reed contact sensor",
+        "reader tamper",
+        "tamper",
+    }
+)
+
+
+def _normalize_suffix(suffix: str) -> str:
+    """Lowercase a door-input suffix and collapse its whitespace."""
+    return " ".join(suffix.lower().split())
+
+
+def _has_public_state(flag: int, data: InceptionSummaryEntry) -> bool:
+    """Return whether the entry's public state has the given flag set."""
+    return data.public_state is not None and (data.public_state & flag) != 0
+
+
+# Shared by every input sensor rather than a closure per entity. Masks are
+# plain ints: public states arrive as ints, and int & IntFlag would dispatch
+# to IntFlag.__rand__ and build a flag instance on every read.
+_input_is_active = partial(_has_public_state, int(InputPublicState.ACTIVE))
+
+# Door state sensors that are noisy enough to start disabled in the registry.
+_DOOR_KEYS_DISABLED_BY_DEFAULT = frozenset({"forced", "dotl"})
+
+
+@lru_cache(maxsize=512)
 def get_device_class_for_name(name: str) -> BinarySensorDeviceClass:
     """
     Define device class from device name.
@@ -49,152 +138,119 @@ def get_device_class_for_name(name: str) -> BinarySensorDeviceClass:
     Device classes are ordered from most specific to least specific to ensure
     accurate matching. For example, "garage door" should match before "door".
     """
-    # Ordered list of (keyword, device_class) tuples
-    # More specific patterns first to avoid false positives
-    device_class_patterns = [
-        # Specific door types (must come before generic "door")
-        ("side door", BinarySensorDeviceClass.DOOR),
-        ("hallway door", BinarySensorDeviceClass.DOOR),
-        ("garage door", BinarySensorDeviceClass.GARAGE_DOOR),
-        ("garage", BinarySensorDeviceClass.GARAGE_DOOR),
-        # Motion and presence detection
-        ("pe beam", BinarySensorDeviceClass.MOTION),
-        ("pir", BinarySensorDeviceClass.MOTION),
-        ("motion", BinarySensorDeviceClass.MOTION),
-        ("beam", BinarySensorDeviceClass.MOTION),
-        # Safety and security
-        ("duress", BinarySensorDeviceClass.SAFETY),
-        ("panic", BinarySensorDeviceClass.SAFETY),
-        ("tamper", BinarySensorDeviceClass.TAMPER),
-        # Glass and window detection
-        ("glass break", BinarySensorDeviceClass.TAMPER),
-        ("glass", BinarySensorDeviceClass.WINDOW),
-        ("louvre", BinarySensorDeviceClass.WINDOW),
-        ("window", BinarySensorDeviceClass.WINDOW),
-        # Environmental sensors
-        ("smoke", BinarySensorDeviceClass.SMOKE),
-        ("gas", BinarySensorDeviceClass.GAS),
-        ("heat", BinarySensorDeviceClass.HEAT),
-        ("cold", BinarySensorDeviceClass.COLD),
-        ("moisture", BinarySensorDeviceClass.MOISTURE),
-        # Vibration and shock
-        ("shock", BinarySensorDeviceClass.TAMPER),
-        ("vibration", BinarySensorDeviceClass.TAMPER),
-        ("break", BinarySensorDeviceClass.TAMPER),
-        # Access control
-        ("rex", BinarySensorDeviceClass.CONNECTIVITY),
-        ("ren", BinarySensorDeviceClass.CONNECTIVITY),
-        ("exit", BinarySensorDeviceClass.CONNECTIVITY),
-        ("entry", BinarySensorDeviceClass.CONNECTIVITY),
-        ("button", BinarySensorDeviceClass.CONNECTIVITY),
-        # Generic types
-        ("contact", BinarySensorDeviceClass.OPENING),
-        ("door", BinarySensorDeviceClass.DOOR),
-        ("gate", BinarySensorDeviceClass.DOOR),
-        ("opening", BinarySensorDeviceClass.OPENING),
-        ("power", BinarySensorDeviceClass.POWER),
-        ("light", BinarySensorDeviceClass.LIGHT),
-    ]
-
     name_lower = name.lower()
 
     # Find the first matching device class or default to 'opening'
-    for keyword, device_class in device_class_patterns:
+    for keyword, device_class in _DEVICE_CLASS_PATTERNS:
         if keyword in name_lower:
             return device_class
 
     return BinarySensorDeviceClass.OPENING
 
 
+_DOOR_STATE_DEVICE_CLASSES: dict[DoorPublicState, BinarySensorDeviceClass] = {
+    DoorPublicState.FORCED: BinarySensorDeviceClass.PROBLEM,
+    DoorPublicState.HELD_OPEN_TOO_LONG: BinarySensorDeviceClass.PROBLEM,
+    DoorPublicState.OPEN: BinarySensorDeviceClass.DOOR,
+    DoorPublicState.READER_TAMPER: BinarySensorDeviceClass.TAMPER,
+}
+
+
 def get_device_class_for_state(state: DoorPublicState) -> BinarySensorDeviceClass:
     """Define device class from device state."""
-    device_classes = {
-        DoorPublicState.FORCED: BinarySensorDeviceClass.PROBLEM,
-        DoorPublicState.HELD_OPEN_TOO_LONG: BinarySensorDeviceClass.PROBLEM,
-        DoorPublicState.OPEN: BinarySensorDeviceClass.DOOR,
-        DoorPublicState.READER_TAMPER: BinarySensorDeviceClass.TAMPER,
-    }
-
     # Find the first matching device class or default to 'opening'
-    return device_classes.get(state, BinarySensorDeviceClass.OPENING)
+    return _DOOR_STATE_DEVICE_CLASSES.get(state, BinarySensorDeviceClass.OPENING)
+
+
+# Door state sensors as (state, name, key suffix, icon). Icons are set
+# because the PROBLEM / TAMPER device classes otherwise fall back to HA's
+# generic alert glyph, which makes forced / held-open / tamper
+# indistinguishable in the UI.
+_DOOR_STATES: tuple[tuple[DoorPublicState, str, str, str | None], ...] = (
+    (DoorPublicState.FORCED, "Forced", "forced", "mdi:lock-open-alert-outline"),
+    (
+        DoorPublicState.HELD_OPEN_TOO_LONG,
+        "Held open too long",
+        "dotl",
+        "mdi:timer-alert-outline",
+    ),
+    (DoorPublicState.OPEN, "Sensor", "open", None),
+    (
+        DoorPublicState.READER_TAMPER,
+        "Reader tamper",
+        "tamper",
+        "mdi:shield-alert-outline",
+    ),
+)
+_DOOR_OPEN_KEY = "door_open"
+
+# Descriptions shared by every door. The "open" sensor's device class is
+# replaced per door from the door name; the others use the state's class.
+_DOOR_DESCRIPTIONS: tuple[InceptionBinarySensorDescription, ...] = tuple(
+    InceptionBinarySensorDescription(
+        key=f"door_{key_suffix}",
+        device_class=get_device_class_for_state(state),
+        name=name,
+        icon=icon,
+        has_entity_name=True,
+        value_fn=partial(_has_public_state, int(state)),
+        entity_registry_enabled_default=key_suffix
+        not in _DOOR_KEYS_DISABLED_BY_DEFAULT,
+    )
+    for state, name, key_suffix, icon in _DOOR_STATES
+)
+
+
+def _door_device_info(door: DoorSummaryEntry) -> DeviceInfo:
+    """Build the DeviceInfo that groups an input with its door's device."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, door.entity_info.id)},
+        name=door.entity_info.name,
+    )
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    _hass: HomeAssistant,
     entry: InceptionConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
-    coordinator: InceptionUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(_iter_entities(entry.runtime_data.coordinator))
 
-    # Create door binary sensors
-    # Define states with human-readable names, key suffixes, and icons. The
-    # PROBLEM / TAMPER device classes otherwise fall back to HA's generic
-    # alert glyph, which makes forced / held-open / tamper indistinguishable
-    # in the UI.
-    door_states = [
-        (DoorPublicState.FORCED, "Forced", "forced", "mdi:lock-open-alert-outline"),
-        (
-            DoorPublicState.HELD_OPEN_TOO_LONG,
-            "Held open too long",
-            "dotl",
-            "mdi:timer-alert-outline",
-        ),
-        (DoorPublicState.OPEN, "Sensor", "open", None),
-        (
-            DoorPublicState.READER_TAMPER,
-            "Reader tamper",
-            "tamper",
-            "mdi:shield-alert-outline",
-        ),
-    ]
 
+def _iter_entities(
+    coordinator: InceptionUpdateCoordinator,
+) -> Iterator[InceptionBinarySensor]:
+    """Yield the door and input binary sensors for the coordinator's data."""
     all_doors = coordinator.data.doors.get_items()
 
-    entities: list[InceptionBinarySensor] = []
-
+    # Create door binary sensors
     for door in all_doors:
-        for state, name, key_suffix, icon in door_states:
+        for description in _DOOR_DESCRIPTIONS:
+            entity_description = description
             # For the "open" sensor, use door name to determine device class
             # (e.g., garage door vs regular door)
-            # For other states, use the state-based device class
-            if state == DoorPublicState.OPEN:
-                device_class = get_device_class_for_name(door.entity_info.name)
-            else:
-                device_class = get_device_class_for_state(state)
-
-            entities.append(
-                InceptionDoorBinarySensor(
-                    coordinator=coordinator,
-                    entity_description=InceptionBinarySensorDescription(
-                        key=f"door_{key_suffix}",
-                        device_class=device_class,
-                        name=name,
-                        icon=icon,
-                        has_entity_name=True,
-                        value_fn=lambda data, state=state: (
-                            data.public_state is not None
-                            and bool(data.public_state & state)
-                        ),
-                        entity_registry_enabled_default=key_suffix
-                        not in ["forced", "dotl"],
-                    ),
-                    data=door,
+            if description.key == _DOOR_OPEN_KEY:
+                entity_description = replace(
+                    description,
+                    device_class=get_device_class_for_name(door.entity_info.name),
                 )
+            yield InceptionDoorBinarySensor(
+                coordinator=coordinator,
+                entity_description=entity_description,
+                data=door,
             )
 
     # Create input binary sensors
     # Skip inputs that match door standard states (forced, held, open, tamper)
     # But create sensors for other door-related inputs (REX, button, etc.)
 
-    # Define regex pattern for standard door state suffixes that are already handled
-    # This matches: forced, held open, dotl, open, sensor, contact,
-    # reed (contact/sensor), tamper, reader tamper
-    standard_door_suffix_pattern = re.compile(
-        r"^(forced|held\s+open(\s+too\s+long)?|dotl|open|sensor|contact|"
-        r"reed(\s+contact)?(\s+sensor)?|reader\s+tamper|tamper)$",
-        re.IGNORECASE,
-    )
+    # Index door names once rather than scanning every door for each input
+    door_index = index_doors_by_name(all_doors)
+    # Inputs grouped under the same door share one DeviceInfo. Sharing is safe
+    # because nothing mutates it: the device registry only reads the
+    # identifiers, merging them into a new set of its own.
+    door_device_infos: dict[str, DeviceInfo] = {}
 
     for i_input in coordinator.data.inputs.get_items():
         input_entity = i_input.entity_info
@@ -203,54 +259,49 @@ async def async_setup_entry(
             # Skip custom inputs (they are a switch)
             continue
 
-        matching_door, suffix = find_matching_door(input_entity.name, all_doors)
+        matching_door, suffix = match_door(input_entity.name, door_index)
 
         if matching_door is not None and suffix:
             # Input matches a door - check if it's a standard state or additional input
-            if standard_door_suffix_pattern.match(suffix):
+            if _normalize_suffix(suffix) in _STANDARD_DOOR_SUFFIXES:
                 # Skip - this is already handled by door binary sensors
                 continue
 
             # Create sensor for non-standard door input (REX, button, etc.)
             # Group it with the door device
             key_suffix = suffix.lower()
-            entities.append(
-                InceptionInputBinarySensor(
-                    coordinator=coordinator,
-                    entity_description=InceptionBinarySensorDescription(
-                        key=f"input_{key_suffix}",
-                        device_class=get_device_class_for_name(input_entity.name),
-                        name=suffix,
-                        has_entity_name=True,
-                        value_fn=lambda data: (
-                            data.public_state is not None
-                            and bool(data.public_state & InputPublicState.ACTIVE)
-                        ),
-                    ),
-                    data=i_input,
-                    door=matching_door,
+            door_id = matching_door.entity_info.id
+            door_device_info = door_device_infos.get(door_id)
+            if door_device_info is None:
+                door_device_info = door_device_infos[door_id] = _door_device_info(
+                    matching_door
                 )
+            yield InceptionInputBinarySensor(
+                coordinator=coordinator,
+                entity_description=InceptionBinarySensorDescription(
+                    key=f"input_{key_suffix}",
+                    device_class=get_device_class_for_name(input_entity.name),
+                    name=suffix,
+                    has_entity_name=True,
+                    value_fn=_input_is_active,
+                ),
+                data=i_input,
+                door=matching_door,
+                door_device_info=door_device_info,
             )
         else:
             # Create standalone binary sensor for inputs that don't match any door
-            entities.append(
-                InceptionInputBinarySensor(
-                    coordinator=coordinator,
-                    entity_description=InceptionBinarySensorDescription(
-                        key="sensor",
-                        device_class=get_device_class_for_name(input_entity.name),
-                        name="Sensor",
-                        value_fn=lambda data: (
-                            data.public_state is not None
-                            and bool(data.public_state & InputPublicState.ACTIVE)
-                        ),
-                    ),
-                    data=i_input,
-                )
+            yield InceptionInputBinarySensor(
+                coordinator=coordinator,
+                entity_description=InceptionBinarySensorDescription(
+                    key="sensor",
+                    device_class=get_device_class_for_name(input_entity.name),
+                    name="Sensor",
+                    value_fn=_input_is_active,
+                ),
+                data=i_input,
             )
 
-    async_add_entities(entities)
-
 
 class InceptionBinarySensor(InceptionEntity, BinarySensorEntity):
     """inception binary_sensor class."""
@@ -265,23 +316,15 @@ class InceptionBinarySensor(InceptionEntity, BinarySensorEntity):
         data: InceptionSummaryEntry,
     ) -> None:
         """Initialize the binary_sensor class."""
-        self.entity_description = entity_description
         self.data = data
-        self.unique_id = entity_description.key
-        self.reporting_id = data.entity_info.reporting_id
         super().__init__(
             coordinator, entity_description=entity_description, inception_object=data
         )
+        self._attr_name = entity_description.name
 
-    @property
-    def is_on(self) -> bool:
-        """Return the state of the binary sensor."""
-        return self.entity_description.value_fn(self.data)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return self.entity_description.name
+    def _update_attrs(self) -> None:
+        """Update binary sensor state attributes."""
+        self._attr_is_on = self.entity_description.value_fn(self.data)
 
 
 class InceptionInputBinarySensor(
@@ -297,21 +340,16 @@ class InceptionInputBinarySensor(
         entity_description: InceptionBinarySensorDescription,
         data: InputSummaryEntry,
         door: DoorSummaryEntry | None = None,
+        door_device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize the binary_sensor class."""
-        self.entity_description = entity_description
         super().__init__(coordinator, entity_description=entity_description, data=data)
 
-        self.data = data
-        self.reporting_id = data.entity_info.reporting_id
         self._device_id = data.entity_info.id
 
         # Override device_info to group with door device instead of creating own device
         if door is not None:
-            self._attr_device_info = DeviceInfo(
-                identifiers={(DOMAIN, door.entity_info.id)},
-                name=door.entity_info.name,
-            )
+            self._attr_device_info = door_device_info or _door_device_info(door)
         else:
             self._attr_device_info = DeviceInfo(
                 identifiers={(DOMAIN, self._device_id)},
@@ -337,7 +375,6 @@ class InceptionDoorBinarySensor(
         """Initialize the binary_sensor class."""
         super().__init__(coordinator, entity_description=entity_description, data=data)
 
-        self.data = data
         self._device_id = data.entity_info.id
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
@@ -32,6 +33,24 @@ if TYPE_CHECKING:
 
     from homeassistant.config_entries import ConfigFlowResult
 
+# Hosts entered without a scheme are assumed to be plain HTTP.
+_URL_SCHEME_RE = re.compile(r"https?://", re.IGNORECASE)
+
+# Selectors carry no per-form state, so every form render shares them; only
+# the vol.Required keys, whose defaults echo earlier input, are rebuilt.
+_NAME_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT),
+)
+_HOST_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.URL),
+)
+_TOKEN_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD),
+)
+_BOOLEAN_SELECTOR = selector.BooleanSelector(selector.BooleanSelectorConfig())
+
+_REAUTH_SCHEMA = vol.Schema({vol.Required(CONF_TOKEN): _TOKEN_SELECTOR})
+
 
 class InceptionFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Inception."""
@@ -53,11 +72,10 @@ class InceptionFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle a flow initialized by the user."""
         _errors = {}
         if user_input is not None:
+            host = user_input[CONF_HOST].strip()
             cleaned_input = {
                 **user_input,
-                CONF_HOST: f"http://{user_input[CONF_HOST]}"
-                if not user_input[CONF_HOST].startswith(("http://", "https://"))
-                else user_input[CONF_HOST],
+                CONF_HOST: host if _URL_SCHEME_RE.match(host) else f"http://{host}",
             }
             try:
                 await self._test_credentials(
@@ -86,27 +104,15 @@ class InceptionFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_NAME,
                         default=(user_input or {}).get(CONF_NAME, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
+                    ): _NAME_SELECTOR,
                     vol.Required(
                         CONF_HOST,
                         default=(user_input or {}).get(CONF_HOST, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.URL,
-                        ),
-                    ),
+                    ): _HOST_SELECTOR,
                     vol.Required(
                         CONF_TOKEN,
                         default=(user_input or {}).get(CONF_TOKEN, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.PASSWORD,
-                        ),
-                    ),
+                    ): _TOKEN_SELECTOR,
                 },
             ),
             errors=_errors,
@@ -159,15 +165,7 @@ class InceptionFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_TOKEN): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.PASSWORD,
-                        ),
-                    ),
-                },
-            ),
+            data_schema=_REAUTH_SCHEMA,
             description_placeholders={"name": entry.title},
             errors=errors,
         )
@@ -194,18 +192,14 @@ class InceptionOptionsFlowHandler(OptionsFlow):
                             CONF_REQUIRE_PIN_CODE,
                             DEFAULT_REQUIRE_PIN_CODE,
                         ),
-                    ): selector.BooleanSelector(
-                        selector.BooleanSelectorConfig(),
-                    ),
+                    ): _BOOLEAN_SELECTOR,
                     vol.Required(
                         CONF_REQUIRE_CODE_TO_ARM,
                         default=self.config_entry.options.get(
                             CONF_REQUIRE_CODE_TO_ARM,
                             DEFAULT_REQUIRE_CODE_TO_ARM,
                         ),
-                    ): selector.BooleanSelector(
-                        selector.BooleanSelectorConfig(),
-                    ),
+                    ): _BOOLEAN_SELECTOR,
                 },
             ),
         )
@@ -16,3 +16,6 @@ CONF_REQUIRE_PIN_CODE = "require_pin_code"
 CONF_REQUIRE_CODE_TO_ARM = "require_code_to_arm"
 DEFAULT_REQUIRE_PIN_CODE = True
 DEFAULT_REQUIRE_CODE_TO_ARM = False
+
+# Review event categories, each toggled by its own switch
+REVIEW_EVENT_CATEGORIES = ("System", "Audit", "Access", "Security", "Hardware")
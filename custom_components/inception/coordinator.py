@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import CONF_HOST, CONF_TOKEN, EVENT_HOMEASSISTANT_STOP
@@ -11,7 +12,7 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, EVENT_REVIEW_EVENT, LOGGER
+from .const import DOMAIN, EVENT_REVIEW_EVENT, LOGGER, REVIEW_EVENT_CATEGORIES
 from .pyinception.api import (
     InceptionApiClient,
     InceptionApiClientAuthenticationError,
@@ -53,6 +54,15 @@ class InceptionUpdateCoordinator(DataUpdateCoordinator[InceptionApiData]):
         self._review_events_global_enabled: bool = False
         self._callbacks_registered: bool = False
 
+    @cached_property
+    def review_store(self) -> Store:
+        """Review event switch settings, shared by the switches and listener."""
+        return Store(
+            self.hass,
+            version=1,
+            key=f"{DOMAIN}.{self.config_entry.entry_id}.review_events",
+        )
+
     async def _async_setup(self) -> None:
         self._shutdown_remove_listener = self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_STOP, self._async_shutdown
@@ -246,18 +256,11 @@ class InceptionUpdateCoordinator(DataUpdateCoordinator[InceptionApiData]):
 
     async def _get_enabled_categories_from_storage(self) -> list[str]:
         """Get enabled categories from storage."""
-        store = Store(
-            self.hass,
-            version=1,
-            key=f"{DOMAIN}.{self.config_entry.entry_id}.review_events",
-        )
-
-        stored_data = await store.async_load() or {}
-        categories = ["System", "Audit", "Access", "Security", "Hardware"]
+        stored_data = await self.review_store.async_load() or {}
 
         return [
             category
-            for category in categories
+            for category in REVIEW_EVENT_CATEGORIES
             if stored_data.get(f"{category.lower()}_enabled", False)
         ]
 
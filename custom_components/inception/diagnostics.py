@@ -8,12 +8,9 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.const import CONF_HOST, CONF_TOKEN
 
-from .const import DOMAIN
-
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
-    from .coordinator import InceptionUpdateCoordinator
     from .data import InceptionConfigEntry
 
 TO_REDACT = {CONF_TOKEN, CONF_HOST}
@@ -53,11 +50,11 @@ def _summary_to_dict(summary: Any) -> dict[str, Any]:
 
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant,
+    _hass: HomeAssistant,
     entry: InceptionConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    coordinator: InceptionUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data.coordinator
     api_data = coordinator.data
 
     return {
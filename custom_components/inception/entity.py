@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from homeassistant.core import callback
@@ -63,6 +64,7 @@ class InceptionEntity(CoordinatorEntity[InceptionUpdateCoordinator]):
             f"{inception_object.entity_info.id}_{entity_description.key}"
         )
         self._inception_object = inception_object
+        self._attr_name = inception_object.entity_info.name
         self._attr_extra_state_attributes = inception_object.extra_fields
         super().__init__(coordinator=coordinator)
         self._update_attrs()
@@ -74,10 +76,10 @@ class InceptionEntity(CoordinatorEntity[InceptionUpdateCoordinator]):
             entity_description.name,
         )
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return self._inception_object.entity_info.name
+    @cached_property
+    def reporting_id(self) -> str:
+        """Return the Inception reporting ID of the underlying object."""
+        return self._inception_object.entity_info.reporting_id
 
     def _update_attrs(self) -> None:
         """Update state attributes."""
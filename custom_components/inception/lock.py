@@ -13,6 +13,7 @@ from homeassistant.components.lock import (
     LockEntity,
     LockEntityDescription,
 )
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers import entity_registry as er
@@ -40,6 +41,13 @@ _LOGGER = logging.getLogger(__name__)
 
 
 SERVICE_UNLOCK = "unlock"
+UNLOCK_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional("time_secs"): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=86399)
+        ),
+    }
+)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -48,12 +56,12 @@ class InceptionDoorEntityDescription(LockEntityDescription):
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    _hass: HomeAssistant,
     entry: InceptionConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
-    coordinator: InceptionUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data.coordinator
 
     entities: list[InceptionLock] = [
         InceptionLock(
@@ -71,13 +79,7 @@ async def async_setup_entry(
     platform = entity_platform.async_get_current_platform()
 
     platform.async_register_entity_service(
-        SERVICE_UNLOCK,
-        {
-            vol.Optional("time_secs"): vol.All(
-                vol.Coerce(int), vol.Range(min=0, max=86399)
-            ),
-        },
-        "unlock_service",
+        SERVICE_UNLOCK, UNLOCK_SCHEMA, "unlock_service"
     )
 
 
@@ -105,9 +107,8 @@ class InceptionLock(InceptionEntity, LockEntity):
             coordinator, entity_description=entity_description, inception_object=data
         )
         self.data = data
-        self.entity_description = entity_description
         self.unique_id = data.entity_info.id
-        self.reporting_id = data.entity_info.reporting_id
+        self._attr_name = "Lock"
         self._device_id = data.entity_info.id
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._device_id)},
@@ -188,11 +189,6 @@ class InceptionLock(InceptionEntity, LockEntity):
                     DEFAULT_UNLOCK_STRATEGY,
                 )
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return "Lock"
-
     @property
     def is_locked(self) -> bool | None:
         """Return true if device is locked."""
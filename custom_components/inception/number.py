@@ -37,12 +37,12 @@ DEFAULT_TIMED_UNLOCK_DURATION = 5
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    _hass: HomeAssistant,
     entry: InceptionConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the number platform."""
-    coordinator: InceptionUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data.coordinator
 
     entities = [
         InceptionTimedUnlockNumber(
@@ -89,7 +89,7 @@ class InceptionNumber(InceptionEntity, NumberEntity):
             coordinator, entity_description=entity_description, inception_object=data
         )
         self.data = data
-        self.entity_description = entity_description
+        self._attr_name = entity_description.name
 
 
 class InceptionTimedUnlockNumber(
@@ -120,11 +120,6 @@ class InceptionTimedUnlockNumber(
             "type": "timed_unlock_duration",
         }
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return self.entity_description.name
-
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         self._attr_native_value = value
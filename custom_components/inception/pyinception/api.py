@@ -5,11 +5,13 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import random
 import socket
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 from urllib.parse import urlencode
 
 import aiohttp
+import orjson
 
 from .data import InceptionApiData
 from .schemas.area import AreaPublicState, AreaSummary
@@ -32,6 +34,16 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_DEFAULT_API_PREFIX = "api/v1"
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=10)
+# Inception long-poll timeout is 60 seconds, this should be enough
+_MONITOR_TIMEOUT = aiohttp.ClientTimeout(total=70)
+# Idempotent GETs are retried on transient connection errors (e.g. a stale
+# keep-alive connection) before the error reaches the caller.
+_GET_ATTEMPTS = 3
+_GET_RETRY_DELAY = 0.5
+_GET_RETRY_MAX_DELAY = 4
+
 
 class InceptionApiClientError(Exception):
     """Exception to indicate a general API error."""
@@ -65,11 +77,19 @@ class InceptionApiClient:
         """Inception API Client."""
         self._token = token
         self._host = host.rstrip("/")
+        self._base_url = f"{self._host}/{_DEFAULT_API_PREFIX}/"
+        # aiohttp copies request headers, so one dict can be shared by all calls.
+        self._headers = {
+            "Authorization": f"APIToken {token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
         self._session = session
         self.data: InceptionApiData | None = None
-        self.data_update_cbs: list = []
-        self.review_event_cbs: list = []
-        self.auth_error_cbs: list = []
+        # Insertion-ordered sets of callbacks, so registration is O(1).
+        self.data_update_cbs: dict[Callable, None] = {}
+        self.review_event_cbs: dict[Callable, None] = {}
+        self.auth_error_cbs: dict[Callable, None] = {}
         self.loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
         self.rest_task: asyncio.Task | None = None
         self._last_update: int | None = None
@@ -280,6 +300,9 @@ class InceptionApiClient:
             _LOGGER.error("No entity data for %s", update_request.api_data)
             return
 
+        # Resolved once per response; the per-event debug line does lookups
+        # to build its arguments even when debug logging is off.
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         for event in result_response.state_data:
             try:
                 if event.id not in entity_data.items:
@@ -289,12 +312,13 @@ class InceptionApiClient:
                     )
                     continue
 
-                _LOGGER.debug(
-                    "Event: %s, %s, %s",
-                    entity_data.items[event.id].entity_info.name,
-                    event.public_state,
-                    event.extra_fields,
-                )
+                if debug:
+                    _LOGGER.debug(
+                        "Event: %s, %s, %s",
+                        entity_data.items[event.id].entity_info.name,
+                        event.public_state,
+                        event.extra_fields,
+                    )
 
                 entity_data.items[event.id].public_state = event.public_state
                 entity_data.items[event.id].extra_fields.update(event.extra_fields)
@@ -417,11 +441,11 @@ class InceptionApiClient:
 
     def _schedule_data_callback(self, cb: Callable) -> None:
         """Schedule a data callback."""
-        self.loop.call_soon_threadsafe(cb, self.data)
+        self.loop.call_soon(cb, self.data)
 
     def _schedule_review_event_callback(self, cb: Callable, event: dict) -> None:
         """Schedule a review event callback."""
-        self.loop.call_soon_threadsafe(cb, event)
+        self.loop.call_soon(cb, event)
 
     def _schedule_data_callbacks(self) -> None:
         """Schedule a data callbacks."""
@@ -430,23 +454,20 @@ class InceptionApiClient:
 
     def register_data_callback(self, callback: Callable) -> None:
         """Register a data update callback."""
-        if callback not in self.data_update_cbs:
-            self.data_update_cbs.append(callback)
+        self.data_update_cbs[callback] = None
 
     def register_review_event_callback(self, callback: Callable) -> None:
         """Register a review event callback."""
-        if callback not in self.review_event_cbs:
-            self.review_event_cbs.append(callback)
+        self.review_event_cbs[callback] = None
 
     def register_auth_error_callback(self, callback: Callable) -> None:
         """Register a callback invoked when the controller rejects auth."""
-        if callback not in self.auth_error_cbs:
-            self.auth_error_cbs.append(callback)
+        self.auth_error_cbs[callback] = None
 
     def _schedule_auth_error_callbacks(self) -> None:
         """Fan out auth-error notifications on the main loop."""
         for cb in self.auth_error_cbs:
-            self.loop.call_soon_threadsafe(cb)
+            self.loop.call_soon(cb)
 
     async def _rest_task(self) -> None:
         """Poll data periodically via Rest."""
@@ -518,10 +539,10 @@ class InceptionApiClient:
 
         # Stop main rest task (which owns the single long-poll connection).
         if self.rest_task:
-            if not self.rest_task.cancelled():
-                self.rest_task.cancel()
+            # cancel() is a no-op on a finished task, so no state check needed.
+            self.rest_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
-                await asyncio.gather(self.rest_task)
+                await self.rest_task
 
         # Clear callback lists to prevent memory leaks
         self.data_update_cbs.clear()
@@ -538,9 +559,7 @@ class InceptionApiClient:
                 method="post",
                 data=payload,
                 path="/monitor-updates",
-                api_timeout=aiohttp.ClientTimeout(
-                    total=70
-                ),  # Inception long-poll timeout is 60 seconds, this should be enough
+                api_timeout=_MONITOR_TIMEOUT,
             )
         except TimeoutError:
             # No response from the API, try again later
@@ -555,13 +574,11 @@ class InceptionApiClient:
     async def _review_events_request(self, query_params: str) -> Any | None:
         """Get review events from the API."""
         try:
-            _LOGGER.debug("Request: %s", f"/review?{query_params}")
+            _LOGGER.debug("Request: /review?%s", query_params)
             response = await self.request(
                 method="get",
                 path=f"/review?{query_params}",
-                api_timeout=aiohttp.ClientTimeout(
-                    total=10
-                ),  # Standard timeout for GET request
+                api_timeout=_DEFAULT_TIMEOUT,
             )
         except TimeoutError:
             # No response from the API, try again later
@@ -578,38 +595,36 @@ class InceptionApiClient:
         method: str,
         path: str,
         data: Any | None = None,
-        api_timeout: aiohttp.ClientTimeout | None = None,
-        api_prefix: str = "api/v1",
+        api_timeout: aiohttp.ClientTimeout = _DEFAULT_TIMEOUT,
+        api_prefix: str = _DEFAULT_API_PREFIX,
     ) -> Any:
         """Get information from the API."""
         try:
-            if api_timeout is None:
-                api_timeout = aiohttp.ClientTimeout(total=10)
-            headers = {
-                "Authorization": f"APIToken {self._token}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            }
-
             # If path begins with a slash, remove it
             path = path.removeprefix("/")
-            prefix = api_prefix.strip("/")
+            base_url = (
+                self._base_url
+                if api_prefix == _DEFAULT_API_PREFIX
+                else f"{self._host}/{api_prefix.strip('/')}/"
+            )
 
-            response = await self._session.request(
+            response = await self._send_request(
                 method=method,
-                url=f"{self._host}/{prefix}/{path}",
-                headers=headers,
-                json=data,
-                timeout=api_timeout,
+                url=base_url + path,
+                data=data,
+                api_timeout=api_timeout,
             )
             if response.status in (401, 403):
                 # Surface 401/403 as a specific auth error so the coordinator
                 # can route it into Home Assistant's re-auth flow rather than
-                # treating it as a transient connection failure.
+                # treating it as a transient connection failure. Release the
+                # unread response so its keep-alive connection returns to the
+                # session's pool (raise_for_status and json() do this too).
+                response.release()
                 msg = "Invalid credentials"
                 raise InceptionApiClientAuthenticationError(msg)  # noqa: TRY301
             response.raise_for_status()
-            return await response.json(content_type=None)
+            return await response.json(loads=orjson.loads, content_type=None)
         except InceptionApiClientError:
             # Our own exception hierarchy must propagate unchanged — the
             # broad `except Exception` below would otherwise rewrap the
@@ -631,6 +646,45 @@ class InceptionApiClient:
                 msg,
             ) from exception
 
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        data: Any | None,
+        api_timeout: aiohttp.ClientTimeout,
+    ) -> aiohttp.ClientResponse:
+        """
+        Send a request, retrying GETs on transient connection errors.
+
+        Other methods (controls and the long-poll) are sent once and left to
+        their callers to recover, as they are not safe to repeat blindly.
+        """
+        attempts = _GET_ATTEMPTS if method == "get" else 1
+        attempt = 1
+        while True:
+            try:
+                return await self._session.request(
+                    method=method,
+                    url=url,
+                    headers=self._headers,
+                    json=data,
+                    timeout=api_timeout,
+                )
+            except (aiohttp.ClientConnectionError, TimeoutError) as err:
+                if attempt >= attempts:
+                    raise
+                delay = min(
+                    _GET_RETRY_DELAY * 2 ** (attempt - 1), _GET_RETRY_MAX_DELAY
+                ) + random.uniform(0, _GET_RETRY_DELAY)  # noqa: S311
+                _LOGGER.debug(
+                    "Request to %s failed (%s), retrying in %.1f seconds",
+                    url,
+                    err,
+                    delay,
+                )
+                attempt += 1
+                await asyncio.sleep(delay)
+
     async def _control_item(self, item: str, data: Any | None = None) -> None:
         """Control the switch."""
         return await self.request(
@@ -35,12 +35,12 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    _hass: HomeAssistant,
     entry: InceptionConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
-    coordinator: InceptionUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data.coordinator
 
     entities = [
         InceptionUnlockStrategySelect(
@@ -86,11 +86,7 @@ class InceptionSelect(InceptionEntity, SelectEntity):
         )
         self.data = data
         self._device_id = data.entity_info.id
-
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return self.entity_description.name
+        self._attr_name = entity_description.name
 
 
 class InceptionUnlockStrategySelect(
@@ -12,7 +12,7 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, EVENT_REVIEW_EVENT
+from .const import EVENT_REVIEW_EVENT
 from .coordinator import InceptionUpdateCoordinator
 from .entity import panel_device_info
 
@@ -26,12 +26,12 @@ if TYPE_CHECKING:
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    _hass: HomeAssistant,
     entry: InceptionConfigEntry,
     async_add_entities: Any,
 ) -> None:
     """Set up the sensor platform."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data.coordinator
 
     entities = [
         InceptionLastReviewEventSensor(
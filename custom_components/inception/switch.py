@@ -14,13 +14,12 @@ from homeassistant.components.switch import (
 from homeassistant.const import EntityCategory
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_registry import async_get
-from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, REVIEW_EVENT_CATEGORIES
 from .entity import InceptionEntity, panel_device_info, panel_identifiers
 from .pyinception.schemas.input import InputPublicState, InputType
 from .pyinception.schemas.output import OutputPublicState
-from .util import find_matching_door
+from .util import index_doors_by_name, match_door
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -53,12 +52,12 @@ class InceptionSwitchDescription(SwitchEntityDescription):
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    _hass: HomeAssistant,
     entry: InceptionConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the switch platform."""
-    coordinator: InceptionUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data.coordinator
 
     entities: list[InceptionSwitch] = [
         InceptionOutputSwitch(
@@ -77,13 +76,13 @@ async def async_setup_entry(
     ]
 
     # Handle all input switches, treating door-related inputs specially
-    doors = coordinator.data.doors.get_items()
+    door_index = index_doors_by_name(coordinator.data.doors.get_items())
 
     for i_input in coordinator.data.inputs.get_items():
         input_entity = i_input.entity_info
         input_name = input_entity.name
 
-        matching_door, suffix = find_matching_door(input_name, doors)
+        matching_door, suffix = match_door(input_name, door_index)
 
         if input_entity.input_type != InputType.SWITCH:
             entities.append(
@@ -142,14 +141,11 @@ async def async_setup_entry(
             )
 
     # Add review event control switches
-    entities += [
-        ReviewEventGlobalSwitch(coordinator=coordinator),
-        ReviewEventCategorySwitch(coordinator=coordinator, category="System"),
-        ReviewEventCategorySwitch(coordinator=coordinator, category="Audit"),
-        ReviewEventCategorySwitch(coordinator=coordinator, category="Access"),
-        ReviewEventCategorySwitch(coordinator=coordinator, category="Security"),
-        ReviewEventCategorySwitch(coordinator=coordinator, category="Hardware"),
-    ]
+    entities.append(ReviewEventGlobalSwitch(coordinator=coordinator))
+    entities.extend(
+        ReviewEventCategorySwitch(coordinator=coordinator, category=category)
+        for category in REVIEW_EVENT_CATEGORIES
+    )
 
     async_add_entities(entities)
 
@@ -171,8 +167,6 @@ class InceptionSwitch(InceptionEntity, SwitchEntity):
             coordinator, entity_description=entity_description, inception_object=data
         )
         self.data = data
-        self.entity_description = entity_description
-        self.reporting_id = data.entity_info.reporting_id
 
     @property
     def is_on(self) -> bool:
@@ -196,17 +190,13 @@ class InceptionInputSwitch(InceptionSwitch, SwitchEntity):
     ) -> None:
         """Initialize the switch class."""
         super().__init__(coordinator, entity_description=entity_description, data=data)
+        self._attr_name = entity_description.name
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, data.entity_info.id)},
             name=data.entity_info.name,
             via_device=panel_identifiers(coordinator),
         )
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return self.entity_description.name
-
     async def async_turn_on(self) -> None:
         """Turn on the switch."""
         if self.entity_description.turn_on_data is None:
@@ -326,12 +316,8 @@ class ReviewEventGlobalSwitch(SwitchEntity):
         self._attr_name = "Review Events"
         self._attr_device_info = panel_device_info(coordinator)
 
-        # Initialize storage for persistent state
-        self._store = Store(
-            coordinator.hass,
-            version=1,
-            key=f"{DOMAIN}.{coordinator.config_entry.entry_id}.review_events",
-        )
+        # Persistent state lives in the coordinator's shared store
+        self._store = coordinator.review_store
 
     async def async_added_to_hass(self) -> None:
         """Load the switch state when added to Home Assistant."""
@@ -407,11 +393,10 @@ class ReviewEventGlobalSwitch(SwitchEntity):
 
         # Force update of all entities by asking Home Assistant to refresh them
         entity_registry = async_get(self.hass)
-        categories = ["system", "audit", "access", "security", "hardware"]
-
-        for category in categories:
+        for category in REVIEW_EVENT_CATEGORIES:
             unique_id = (
-                f"{self.coordinator.config_entry.entry_id}_review_events_{category}"
+                f"{self.coordinator.config_entry.entry_id}"
+                f"_review_events_{category.lower()}"
             )
             entity_id = entity_registry.async_get_entity_id("switch", DOMAIN, unique_id)
 
@@ -453,12 +438,8 @@ class ReviewEventCategorySwitch(SwitchEntity):
         self._attr_name = f"Review Events {category}"
         self._attr_device_info = panel_device_info(coordinator)
 
-        # Initialize storage for persistent state
-        self._store = Store(
-            coordinator.hass,
-            version=1,
-            key=f"{DOMAIN}.{coordinator.config_entry.entry_id}.review_events",
-        )
+        # Persistent state lives in the coordinator's shared store
+        self._store = coordinator.review_store
 
     async def async_added_to_hass(self) -> None:
         """Load the switch state when added to Home Assistant."""
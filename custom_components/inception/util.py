@@ -7,6 +7,55 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .pyinception.schemas.door import DoorSummaryEntry
 
+type DoorIndex = dict[str, tuple[int, DoorSummaryEntry]]
+
+
+def index_doors_by_name(doors: list[DoorSummaryEntry]) -> DoorIndex:
+    """
+    Index doors by name for repeated `match_door` lookups.
+
+    Each name maps to the door's position in `doors` and the door itself. When
+    names repeat, the first door wins, as it would in a linear scan.
+    """
+    index: DoorIndex = {}
+    for position, door in enumerate(doors):
+        index.setdefault(door.entity_info.name, (position, door))
+    return index
+
+
+def match_door(
+    value: str, door_index: DoorIndex
+) -> tuple[DoorSummaryEntry | None, str | None]:
+    """
+    Find a matching door for an input name in a prebuilt door index.
+
+    Both separators start with a space, so only the prefixes of `value` that
+    end before a space can be door names. Each is looked up directly instead of
+    testing every door; the earliest door in the original list wins.
+
+    Returns:
+        Tuple of (DoorSummaryEntry, suffix) or (None, None) if no match.
+
+    """
+    best: tuple[int, DoorSummaryEntry] | None = None
+    best_end = 0
+    end = value.find(" ")
+    while end != -1:
+        candidate = door_index.get(value[:end])
+        if candidate is not None and (best is None or candidate[0] < best[0]):
+            best = candidate
+            best_end = end
+        end = value.find(" ", end + 1)
+
+    if best is None:
+        return None, None
+
+    rest = value[best_end:]
+    # Check for " - " separator, then fall back to the space separator
+    if rest.startswith(" - "):
+        return best[1], rest[3:]
+    return best[1], rest[1:]
+
 
 def find_matching_door(
     value: str, doors: list[DoorSummaryEntry]
@@ -22,15 +71,4 @@ def find_matching_door(
         Tuple of (DoorSummaryEntry, suffix) or (None, None) if no match.
 
     """
-    for door in doors:
-        door_name = door.entity_info.name
-        if value.startswith(door_name):
-            # Check for " - " separator
-            if value.startswith(f"{door_name} - "):
-                suffix = value[len(door_name) + 3 :]
-                return door, suffix
-            # Check for space separator
-            if value.startswith(f"{door_name} "):
-                suffix = value[len(door_name) + 1 :]
-                return door, suffix
-    return None, None
+    return match_door(value, index_doors_by_name(doors))
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from homeassistant.const import Platform
+from homeassistant.exceptions import ConfigEntryNotReady
 
 from custom_components.inception import (
     PLATFORMS,
@@ -48,6 +50,64 @@ class TestInceptionIntegration:
         assert callable(async_remove_entry)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("first_refresh", "expected_error"),
+    [
+        (AsyncMock(), None),
+        (AsyncMock(side_effect=ConfigEntryNotReady("offline")), ConfigEntryNotReady),
+    ],
+)
+async def test_async_setup_entry_awaits_platform_import(
+    first_refresh: AsyncMock, expected_error: type[Exception] | None
+) -> None:
+    """Test that the platform import is awaited whether or not the refresh fails."""
+    mock_hass = Mock()
+    mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
+    mock_entry = Mock()
+    mock_entry.entry_id = "test_entry_id"
+    mock_entry.domain = DOMAIN
+
+    mock_coordinator = Mock()
+    mock_coordinator.async_config_entry_first_refresh = first_refresh
+
+    # The import outlasts the refresh, as it would while modules load
+    imported: list[bool] = []
+
+    async def _get_platforms(_platforms: object) -> dict:
+        await asyncio.sleep(0.01)
+        imported.append(True)
+        return {}
+
+    mock_integration = Mock()
+    mock_integration.async_get_platforms = Mock(side_effect=_get_platforms)
+
+    with (
+        patch(
+            "custom_components.inception.InceptionUpdateCoordinator",
+            return_value=mock_coordinator,
+        ),
+        patch(
+            "custom_components.inception.async_get_loaded_integration",
+            return_value=mock_integration,
+        ),
+        patch("custom_components.inception.dr.async_get"),
+        patch("custom_components.inception.panel_device_info", return_value={}),
+    ):
+        if expected_error is None:
+            assert await async_setup_entry(mock_hass, mock_entry) is True
+        else:
+            with pytest.raises(expected_error):
+                await async_setup_entry(mock_hass, mock_entry)
+
+    assert imported == [True]
+    forward = mock_hass.config_entries.async_forward_entry_setups
+    if expected_error is None:
+        forward.assert_awaited_once_with(mock_entry, PLATFORMS)
+    else:
+        forward.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_async_unload_entry_cleans_up_coordinator() -> None:
     """Test that async_unload_entry properly cleans up the coordinator."""
@@ -60,8 +120,7 @@ async def test_async_unload_entry_cleans_up_coordinator() -> None:
     mock_coordinator = Mock()
     mock_coordinator.async_unload = AsyncMock()
 
-    # Set up hass.data with the coordinator
-    mock_hass.data = {DOMAIN: {mock_entry.entry_id: mock_coordinator}}
+    mock_entry.runtime_data.coordinator = mock_coordinator
 
     # Mock async_unload_platforms to return True
     mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
@@ -77,9 +136,6 @@ async def test_async_unload_entry_cleans_up_coordinator() -> None:
     # Verify coordinator was cleaned up
     mock_coordinator.async_unload.assert_called_once()
 
-    # Verify coordinator was removed from hass.data
-    assert mock_entry.entry_id not in mock_hass.data[DOMAIN]
-
     # Verify function returned True
     assert result is True
 
@@ -96,8 +152,7 @@ async def test_async_unload_entry_fails_if_platforms_fail() -> None:
     mock_coordinator = Mock()
     mock_coordinator.async_unload = AsyncMock()
 
-    # Set up hass.data with the coordinator
-    mock_hass.data = {DOMAIN: {mock_entry.entry_id: mock_coordinator}}
+    mock_entry.runtime_data.coordinator = mock_coordinator
 
     # Mock async_unload_platforms to return False (failure)
     mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=False)
@@ -113,9 +168,6 @@ async def test_async_unload_entry_fails_if_platforms_fail() -> None:
     # Verify coordinator was NOT cleaned up (since platforms failed)
     mock_coordinator.async_unload.assert_not_called()
 
-    # Verify coordinator was NOT removed from hass.data
-    assert mock_entry.entry_id in mock_hass.data[DOMAIN]
-
     # Verify function returned False
     assert result is False
 
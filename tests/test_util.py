@@ -4,7 +4,11 @@ from unittest.mock import Mock
 
 import pytest
 
-from custom_components.inception.util import find_matching_door
+from custom_components.inception.util import (
+    find_matching_door,
+    index_doors_by_name,
+    match_door,
+)
 
 
 def create_mock_door(name: str, door_id: str = "") -> Mock:
@@ -100,3 +104,15 @@ def test_find_matching_door_prefix_ambiguity() -> None:
 
     assert matched_door_rev.entity_info.name == "Front Door"
     assert suffix_rev == "Reed"
+
+
+def test_match_door_reuses_index() -> None:
+    """One index serves many inputs and keeps the first of duplicate names."""
+    door_first = create_mock_door("Front Door", "1")
+    door_duplicate = create_mock_door("Front Door", "2")
+    door_back = create_mock_door("Back Door", "3")
+    index = index_doors_by_name([door_first, door_duplicate, door_back])
+
+    assert match_door("Front Door - Reed", index) == (door_first, "Reed")
+    assert match_door("Back Door REX", index) == (door_back, "REX")
+    assert match_door("Kitchen PIR", index) == (None, None)
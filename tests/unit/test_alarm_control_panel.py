@@ -17,6 +17,8 @@ from homeassistant.components.alarm_control_panel.const import (
 )
 
 from custom_components.inception.alarm_control_panel import (
+    _STATE_MAPPINGS,
+    _STATE_MASK,
     InceptionAlarm,
     InceptionAlarmDescription,
     async_setup_entry,
@@ -115,6 +117,7 @@ class TestInceptionAlarm:
         """Test alarm entity initialization."""
         assert alarm_entity._attr_unique_id == "area_123_area_alarm"
         assert alarm_entity.entity_description.name == "Test Area"
+        assert alarm_entity.name == "Test Area"
         assert alarm_entity.data.entity_info.id == "area_123"
 
     def test_supported_features_multi_mode(
@@ -177,14 +180,56 @@ class TestInceptionAlarm:
     ) -> None:
         """Test alarm state mapping from area states."""
         alarm_entity.data.public_state = area_state
+        alarm_entity._update_attrs()
         assert alarm_entity.alarm_state == expected_alarm_state
 
+    @pytest.mark.parametrize(
+        ("public_state", "expected_alarm_state"),
+        [
+            (
+                AreaPublicState.ALARM | AreaPublicState.ARMED,
+                AlarmControlPanelState.TRIGGERED,
+            ),
+            (
+                AreaPublicState.EXIT_DELAY | AreaPublicState.AWAY_ARM,
+                AlarmControlPanelState.PENDING,
+            ),
+            (
+                AreaPublicState.STAY_ARM | AreaPublicState.ARMED,
+                AlarmControlPanelState.ARMED_HOME,
+            ),
+            (
+                AreaPublicState.DISARMED | AreaPublicState.ARM_READY,
+                AlarmControlPanelState.DISARMED,
+            ),
+            (0x0800 | 0x1000, AlarmControlPanelState.DISARMED),
+            (AreaPublicState.ARM_READY, None),
+        ],
+    )
+    def test_alarm_state_priority(
+        self,
+        alarm_entity: InceptionAlarm,
+        public_state: int,
+        expected_alarm_state: AlarmControlPanelState | None,
+    ) -> None:
+        """Test combined flags resolve to the highest-priority alarm state."""
+        alarm_entity.data.public_state = public_state
+        alarm_entity._update_attrs()
+        assert alarm_entity.alarm_state == expected_alarm_state
+
+    def test_state_masks_are_plain_ints(self) -> None:
+        """Test masks are ints so int public states never build IntFlags."""
+        assert type(_STATE_MASK) is int
+        assert all(type(mask) is int for mask, _ in _STATE_MAPPINGS)
+        assert type(0x0800 & _STATE_MASK) is int
+
     def test_alarm_state_none_when_no_public_state(
         self, alarm_entity: InceptionAlarm
     ) -> None:
         """Test alarm state returns None when no public state."""
         # Use mock to bypass type checking
         with patch.object(alarm_entity.data, "public_state", None):
+            alarm_entity._update_attrs()
             assert alarm_entity.alarm_state is None
 
     @pytest.mark.asyncio
@@ -554,7 +599,7 @@ class TestAlarmEntityKeys:
         )
 
         self.added_entities = []
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Mock the entity_platform module
         with patch(
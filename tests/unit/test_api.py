@@ -144,7 +144,7 @@ class TestReviewEventCallbacks:
 
         scheduled: list[tuple[Mock, dict]] = []
         api_client.loop = SimpleNamespace(
-            call_soon_threadsafe=lambda cb, event: scheduled.append((cb, event))
+            call_soon=lambda cb, event: scheduled.append((cb, event))
         )
 
         api_client._handle_review_events_response(bundled_response)
@@ -556,7 +556,7 @@ class TestRequestApiPrefix:
         mock_response.status = 200
         mock_response.raise_for_status.return_value = None
 
-        async def _json(content_type: Any = None) -> dict[str, int]:  # noqa: ARG001
+        async def _json(**_kwargs: Any) -> dict[str, int]:
             return {"ProtocolVersion": 8}
 
         mock_response.json = _json
@@ -586,7 +586,7 @@ class TestRequestApiPrefix:
         mock_response.status = 200
         mock_response.raise_for_status.return_value = None
 
-        async def _json(content_type: Any = None) -> dict[str, str]:  # noqa: ARG001
+        async def _json(**_kwargs: Any) -> dict[str, str]:
             return {}
 
         mock_response.json = _json
@@ -604,6 +604,82 @@ class TestRequestApiPrefix:
         assert called_url == "http://h.test/api/v1/control/input"
 
 
+def _no_retry_delay() -> contextlib.AbstractContextManager:
+    """Zero the GET retry backoff so retries run without waiting."""
+    return patch.multiple(
+        "custom_components.inception.pyinception.api",
+        _GET_RETRY_DELAY=0,
+        _GET_RETRY_MAX_DELAY=0,
+    )
+
+
+class TestRequestRetry:
+    """Tests for retrying transient connection errors in request()."""
+
+    @staticmethod
+    def _ok_response() -> Mock:
+        response = Mock()
+        response.status = 200
+        response.raise_for_status.return_value = None
+
+        async def _json(**_kwargs: Any) -> dict[str, bool]:
+            return {"ok": True}
+
+        response.json = _json
+        return response
+
+    @pytest.mark.asyncio
+    async def test_get_retries_connection_error(self) -> None:
+        """A GET that hits a dropped connection is retried and succeeds."""
+        mock_session = Mock(spec=aiohttp.ClientSession)
+        mock_session.request = Mock(
+            side_effect=[
+                aiohttp.ServerDisconnectedError(),
+                _AwaitableValue(self._ok_response()),
+            ]
+        )
+        client = InceptionApiClient(
+            token="t", host="http://h.test", session=mock_session
+        )
+
+        with _no_retry_delay():
+            result = await client.request(method="get", path="/control/input")
+
+        assert result == {"ok": True}
+        assert mock_session.request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_gives_up_after_max_attempts(self) -> None:
+        """Persistent connection errors still surface as communication errors."""
+        mock_session = Mock(spec=aiohttp.ClientSession)
+        mock_session.request = Mock(side_effect=aiohttp.ServerDisconnectedError())
+        client = InceptionApiClient(
+            token="t", host="http://h.test", session=mock_session
+        )
+
+        with (
+            _no_retry_delay(),
+            pytest.raises(InceptionApiClientCommunicationError),
+        ):
+            await client.request(method="get", path="/control/input")
+
+        assert mock_session.request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_post_is_not_retried(self) -> None:
+        """Control POSTs are never repeated automatically."""
+        mock_session = Mock(spec=aiohttp.ClientSession)
+        mock_session.request = Mock(side_effect=aiohttp.ServerDisconnectedError())
+        client = InceptionApiClient(
+            token="t", host="http://h.test", session=mock_session
+        )
+
+        with pytest.raises(InceptionApiClientCommunicationError):
+            await client.request(method="post", path="/control/output/1/activity")
+
+        assert mock_session.request.call_count == 1
+
+
 class TestBundledLongPoll:
     """The single long-poll now bundles entity-state AND review-event requests."""
 
@@ -37,7 +37,7 @@ class TestAuthErrorCallback:
         client.register_auth_error_callback(cb)
         client.register_auth_error_callback(cb)
 
-        assert client.auth_error_cbs.count(cb) == 1
+        assert list(client.auth_error_cbs).count(cb) == 1
 
     @pytest.mark.asyncio
     async def test_rest_task_fires_auth_callback_on_auth_error(
@@ -48,9 +48,7 @@ class TestAuthErrorCallback:
             token="t", host="http://h.test", session=mock_session
         )
         scheduled: list[object] = []
-        client.loop = SimpleNamespace(
-            call_soon_threadsafe=lambda cb, *_: scheduled.append(cb)
-        )
+        client.loop = SimpleNamespace(call_soon=lambda cb, *_: scheduled.append(cb))
 
         cb = Mock()
         client.register_auth_error_callback(cb)
@@ -77,15 +75,21 @@ class TestRequestPreservesAuthErrorType:
 
         class _Resp:
             status = 401
+            released = False
 
             def raise_for_status(self) -> None:
                 return None
 
-            async def json(self, content_type: object = None) -> dict[str, str]:  # noqa: ARG002
+            def release(self) -> None:
+                self.released = True
+
+            async def json(self, **_kwargs: object) -> dict[str, str]:
                 return {}
 
+        response = _Resp()
+
         async def fake_request(*_args: object, **_kwargs: object) -> _Resp:
-            return _Resp()
+            return response
 
         mock_session.request = fake_request
 
@@ -98,6 +102,8 @@ class TestRequestPreservesAuthErrorType:
         # exception. Assert the specific type survives.
         with pytest.raises(InceptionApiClientAuthenticationError):
             await client.request(method="get", path="/control/input")
+        # The unread body is released so the connection returns to the pool
+        assert response.released
 
     @pytest.mark.asyncio
     async def test_403_response_raises_auth_error_not_generic(self) -> None:
@@ -106,15 +112,21 @@ class TestRequestPreservesAuthErrorType:
 
         class _Resp:
             status = 403
+            released = False
 
             def raise_for_status(self) -> None:
                 return None
 
-            async def json(self, content_type: object = None) -> dict[str, str]:  # noqa: ARG002
+            def release(self) -> None:
+                self.released = True
+
+            async def json(self, **_kwargs: object) -> dict[str, str]:
                 return {}
 
+        response = _Resp()
+
         async def fake_request(*_args: object, **_kwargs: object) -> _Resp:
-            return _Resp()
+            return response
 
         mock_session.request = fake_request
 
@@ -124,6 +136,7 @@ class TestRequestPreservesAuthErrorType:
 
         with pytest.raises(InceptionApiClientAuthenticationError):
             await client.request(method="get", path="/control/input")
+        assert response.released
 
 
 class TestCoordinatorReauthIntegration:
@@ -4,14 +4,37 @@ from collections.abc import Iterable
 from unittest.mock import Mock
 
 import pytest
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.helpers.entity import Entity
 
-from custom_components.inception.binary_sensor import async_setup_entry
+from custom_components.inception.binary_sensor import (
+    async_setup_entry,
+    get_device_class_for_name,
+)
 from custom_components.inception.coordinator import InceptionUpdateCoordinator
 from custom_components.inception.pyinception.schemas.door import DoorPublicState
 from custom_components.inception.pyinception.schemas.input import InputPublicState
 
 
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Front Door", BinarySensorDeviceClass.DOOR),
+        ("Garage Door", BinarySensorDeviceClass.GARAGE_DOOR),
+        # Keyword priority follows the table, not the position in the name
+        ("Door to Garage", BinarySensorDeviceClass.GARAGE_DOOR),
+        ("LOUNGE PIR", BinarySensorDeviceClass.MOTION),
+        ("Glass Break Detector", BinarySensorDeviceClass.TAMPER),
+        ("Kitchen", BinarySensorDeviceClass.OPENING),
+    ],
+)
+def test_get_device_class_for_name(
+    name: str, expected: BinarySensorDeviceClass
+) -> None:
+    """Device class is picked by the first matching keyword in the table."""
+    assert get_device_class_for_name(name) == expected
+
+
 class TestBinarySensorKeys:
     """Test binary sensor entity key generation."""
 
@@ -76,7 +99,7 @@ class TestBinarySensorKeys:
             added_entities.extend(new_entities)
 
         # Set up HASS data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Call async_setup_entry
         await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
@@ -96,6 +119,41 @@ class TestBinarySensorKeys:
         actual_keys = [entity._attr_unique_id for entity in added_entities]
         assert sorted(actual_keys) == sorted(expected_keys)
 
+    @pytest.mark.asyncio
+    async def test_door_binary_sensor_state_follows_updates(
+        self, mock_coordinator: Mock, mock_hass: Mock, mock_entry: Mock
+    ) -> None:
+        """is_on is resolved at creation and refreshed by _update_attrs."""
+        mock_door = Mock()
+        mock_door.entity_info.id = "door_123"
+        mock_door.entity_info.name = "Front Door"
+        mock_door.public_state = DoorPublicState.OPEN
+        mock_coordinator.data.doors = Mock()
+        mock_coordinator.data.doors.get_items = Mock(return_value=[mock_door])
+
+        added_entities = []
+
+        def mock_async_add_entities(
+            new_entities: Iterable[Entity],
+            update_before_add: bool = False,  # noqa: FBT001, FBT002, ARG001
+        ) -> None:
+            added_entities.extend(new_entities)
+
+        mock_entry.runtime_data.coordinator = mock_coordinator
+        await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
+
+        sensors = {entity.entity_description.key: entity for entity in added_entities}
+        assert sensors["door_open"].name == "Sensor"
+        assert sensors["door_open"].is_on is True
+        assert sensors["door_forced"].is_on is False
+
+        mock_door.public_state = int(DoorPublicState.FORCED)
+        for entity in added_entities:
+            entity._update_attrs()
+
+        assert sensors["door_open"].is_on is False
+        assert sensors["door_forced"].is_on is True
+
     @pytest.mark.asyncio
     async def test_door_binary_sensor_names(
         self, mock_coordinator: Mock, mock_hass: Mock, mock_entry: Mock
@@ -123,7 +181,7 @@ class TestBinarySensorKeys:
             added_entities.extend(new_entities)
 
         # Set up HASS data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Call async_setup_entry
         await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
@@ -176,7 +234,7 @@ class TestBinarySensorKeys:
             added_entities.extend(new_entities)
 
         # Set up HASS data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Call async_setup_entry
         await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
@@ -213,7 +271,7 @@ class TestBinarySensorKeys:
             added_entities.extend(new_entities)
 
         # Set up HASS data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Call async_setup_entry
         await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
@@ -257,7 +315,7 @@ class TestBinarySensorKeys:
             added_entities.extend(new_entities)
 
         # Set up HASS data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Call async_setup_entry
         await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
@@ -315,7 +373,7 @@ class TestBinarySensorKeys:
             added_entities.extend(new_entities)
 
         # Set up HASS data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Call async_setup_entry
         await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
@@ -369,7 +427,7 @@ class TestBinarySensorKeys:
             added_entities.extend(new_entities)
 
         # Set up HASS data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Call async_setup_entry
         await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
@@ -399,6 +457,51 @@ class TestBinarySensorKeys:
         ]  # pyright: ignore[reportTypedDictNotRequiredAccess]
         assert input_sensor._attr_device_info["name"] == "Front Door"  # pyright: ignore[reportTypedDictNotRequiredAccess]
 
+    @pytest.mark.asyncio
+    async def test_inputs_under_same_door_share_device_info(
+        self, mock_coordinator: Mock, mock_hass: Mock, mock_entry: Mock
+    ) -> None:
+        """Test that inputs grouped under one door share a single DeviceInfo."""
+        mock_door = Mock()
+        mock_door.entity_info = Mock()
+        mock_door.entity_info.id = "door_123"
+        mock_door.entity_info.name = "Front Door"
+        mock_door.entity_info.reporting_id = "1"
+        mock_door.public_state = DoorPublicState.OPEN
+
+        mock_inputs = []
+        for input_id, name in (("input_456", "REX"), ("input_457", "Button")):
+            mock_input = Mock()
+            mock_input.entity_info = Mock()
+            mock_input.entity_info.id = input_id
+            mock_input.entity_info.name = f"Front Door - {name}"
+            mock_input.entity_info.reporting_id = input_id
+            mock_input.entity_info.is_custom_input = False
+            mock_input.public_state = InputPublicState.ACTIVE
+            mock_inputs.append(mock_input)
+
+        mock_coordinator.data.doors = Mock()
+        mock_coordinator.data.doors.get_items = Mock(return_value=[mock_door])
+        mock_coordinator.data.inputs.get_items = Mock(return_value=mock_inputs)
+
+        added_entities = []
+
+        def mock_async_add_entities(
+            new_entities: Iterable[Entity],
+            update_before_add: bool = False,  # noqa: FBT001, FBT002, ARG001
+        ) -> None:
+            added_entities.extend(new_entities)
+
+        mock_entry.runtime_data.coordinator = mock_coordinator
+
+        await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
+
+        rex, button = (
+            e for e in added_entities if e._attr_unique_id.startswith("input_")
+        )
+        assert rex._attr_device_info is button._attr_device_info
+        assert rex._attr_device_info["name"] == "Front Door"  # pyright: ignore[reportTypedDictNotRequiredAccess]
+
     @pytest.mark.asyncio
     async def test_input_matching_door_standard_suffix_variations_skipped(
         self, mock_coordinator: Mock, mock_hass: Mock, mock_entry: Mock
@@ -418,6 +521,7 @@ class TestBinarySensorKeys:
             "REED",
             "Reed Contact",
             "Reed Contact Sensor",
+            "Reed  Sensor",
             "Sensor",
             "Forced",
             "Tamper",
@@ -454,7 +558,7 @@ class TestBinarySensorKeys:
             added_entities.extend(new_entities)
 
         # Set up HASS data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Call async_setup_entry
         await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
@@ -508,7 +612,7 @@ class TestBinarySensorKeys:
             added_entities.extend(new_entities)
 
         # Set up HASS data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Call async_setup_entry
         await async_setup_entry(mock_hass, mock_entry, mock_async_add_entities)
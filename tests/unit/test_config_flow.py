@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock, Mock
+
+import pytest
 from homeassistant.config_entries import OptionsFlow
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_TOKEN
 
 from custom_components.inception.config_flow import (
     InceptionFlowHandler,
@@ -40,6 +44,40 @@ class TestInceptionFlowHandler:
         assert hasattr(InceptionFlowHandler, "async_get_options_flow")
         assert callable(InceptionFlowHandler.async_get_options_flow)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("host", "expected_host"),
+        [
+            ("host", "http://host"),
+            (" host ", "http://host"),
+            ("https://host", "https://host"),
+            ("HTTP://host", "HTTP://host"),
+        ],
+    )
+    async def test_user_step_normalizes_host(
+        self, host: str, expected_host: str
+    ) -> None:
+        """Test that the user step only adds a scheme when the host has none."""
+        handler = InceptionFlowHandler()
+        handler._test_credentials = AsyncMock()
+        handler.async_create_entry = Mock()
+
+        await handler.async_step_user(
+            {CONF_NAME: "Inception", CONF_HOST: host, CONF_TOKEN: "token"}
+        )
+
+        handler._test_credentials.assert_awaited_once_with(
+            token="token", host=expected_host
+        )
+        handler.async_create_entry.assert_called_once_with(
+            title="Inception",
+            data={
+                CONF_NAME: "Inception",
+                CONF_HOST: expected_host,
+                CONF_TOKEN: "token",
+            },
+        )
+
 
 class TestInceptionOptionsFlowHandler:
     """Test InceptionOptionsFlowHandler class."""
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from custom_components.inception.coordinator import InceptionUpdateCoordinator
@@ -23,3 +26,26 @@ class TestInceptionUpdateCoordinator:
         """Test coordinator inheritance."""
         # Test inheritance
         assert issubclass(InceptionUpdateCoordinator, DataUpdateCoordinator)
+
+    @pytest.mark.asyncio
+    async def test_enabled_categories_read_from_shared_store(self) -> None:
+        """Test that enabled categories come from one store, in category order."""
+        coordinator = InceptionUpdateCoordinator.__new__(InceptionUpdateCoordinator)
+        coordinator.hass = Mock()
+        coordinator.config_entry = Mock(entry_id="entry-1")
+
+        store = Mock()
+        store.async_load = AsyncMock(
+            return_value={"security_enabled": True, "system_enabled": True}
+        )
+
+        with patch(
+            "custom_components.inception.coordinator.Store", return_value=store
+        ) as store_cls:
+            assert coordinator.review_store is coordinator.review_store
+            categories = await coordinator._get_enabled_categories_from_storage()
+
+        store_cls.assert_called_once_with(
+            coordinator.hass, version=1, key="inception.entry-1.review_events"
+        )
+        assert categories == ["System", "Security"]
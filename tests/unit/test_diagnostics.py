@@ -10,7 +10,6 @@ from unittest.mock import AsyncMock
 import pytest
 
 from custom_components.inception import diagnostics
-from custom_components.inception.const import DOMAIN
 
 
 @dataclass
@@ -109,6 +108,7 @@ class TestAsyncGetConfigEntryDiagnostics:
         )
         entry = SimpleNamespace(
             entry_id="entry-1",
+            runtime_data=SimpleNamespace(coordinator=coordinator),
             title="Test Inception",
             version=1,
             data={
@@ -118,7 +118,7 @@ class TestAsyncGetConfigEntryDiagnostics:
             },
             options={"require_pin_code": True},
         )
-        hass = SimpleNamespace(data={DOMAIN: {"entry-1": coordinator}})
+        hass = SimpleNamespace()
 
         # async_redact_data is sync, but the function is async; call directly.
         result = await diagnostics.async_get_config_entry_diagnostics(
@@ -152,12 +152,13 @@ class TestAsyncGetConfigEntryDiagnostics:
         )
         entry = SimpleNamespace(
             entry_id="entry-2",
+            runtime_data=SimpleNamespace(coordinator=coordinator),
             title="T",
             version=1,
             data={"host": "h", "token": "t", "name": "n"},
             options={},
         )
-        hass = SimpleNamespace(data={DOMAIN: {"entry-2": coordinator}})
+        hass = SimpleNamespace()
 
         result = await diagnostics.async_get_config_entry_diagnostics(
             hass,  # type: ignore[arg-type]
@@ -186,12 +187,13 @@ class TestAsyncGetConfigEntryDiagnostics:
         coordinator.async_refresh = AsyncMock()
         entry = SimpleNamespace(
             entry_id="entry-3",
+            runtime_data=SimpleNamespace(coordinator=coordinator),
             title="T",
             version=1,
             data={"host": "h", "token": "t"},
             options={},
         )
-        hass = SimpleNamespace(data={DOMAIN: {"entry-3": coordinator}})
+        hass = SimpleNamespace()
 
         result = await diagnostics.async_get_config_entry_diagnostics(
             hass,  # type: ignore[arg-type]
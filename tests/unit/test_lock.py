@@ -125,7 +125,7 @@ class TestLockEntityKeys:
         )
 
         self.added_entities = []
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Mock the entity_platform module
         with patch(
@@ -84,7 +84,7 @@ class TestNumberEntityKeys:
         mock_coordinator.data.doors.get_items = Mock(return_value=[mock_door])
 
         self.added_entities = []
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         await number_setup(mock_hass, mock_entry, self.mock_async_add_entities)
 
@@ -106,7 +106,7 @@ class TestNumberEntityKeys:
         mock_door.public_state = DoorPublicState.OPEN
 
         mock_coordinator.data.doors.get_items = Mock(return_value=[mock_door])
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Test number
         self.added_entities = []
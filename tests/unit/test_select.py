@@ -82,7 +82,7 @@ class TestSelectEntityKeys:
         mock_coordinator.data.doors.get_items = Mock(return_value=[mock_door])
 
         self.added_entities = []
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         await async_setup_entry(mock_hass, mock_entry, self.mock_async_add_entities)
 
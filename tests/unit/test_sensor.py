@@ -209,7 +209,7 @@ class TestSensorEntityKeys:
         mock_coordinator.review_events_global_enabled = False
 
         self.added_entities = []
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         await async_setup_entry(mock_hass, mock_entry, self.mock_async_add_entities)
 
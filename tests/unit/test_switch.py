@@ -19,6 +19,7 @@ from custom_components.inception.pyinception.schemas.input import (
 from custom_components.inception.pyinception.schemas.output import OutputPublicState
 from custom_components.inception.switch import (
     InceptionLogicalInputSwitch,
+    InceptionOutputSwitch,
     InceptionSwitch,
     InceptionSwitchDescription,
     ReviewEventGlobalSwitch,
@@ -87,6 +88,9 @@ class TestInceptionSwitch:
 
         # Assert that unique_id is set from entity_description.key
         assert switch.unique_id == "input_123_test_unique_key_456"
+        # reporting_id is derived lazily from the entity info
+        assert "reporting_id" not in switch.__dict__
+        assert switch.reporting_id == "REP_123"
 
 
 class TestInceptionLogicalInputSwitch:
@@ -207,8 +211,7 @@ class TestAsyncSetupEntry:
 
         mock_coordinator.data = mock_data
 
-        # Set up hass.data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Mock async_add_entities
         mock_async_add_entities = MagicMock()
@@ -283,8 +286,7 @@ class TestAsyncSetupEntry:
 
         mock_coordinator.data = mock_data
 
-        # Set up hass.data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Mock async_add_entities
         mock_async_add_entities = MagicMock()
@@ -352,8 +354,7 @@ class TestAsyncSetupEntry:
 
         mock_coordinator.data = mock_data
 
-        # Set up hass.data
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         # Mock async_add_entities
         mock_async_add_entities = MagicMock()
@@ -447,7 +448,7 @@ class TestSwitchEntityKeys:
         mock_coordinator.review_events_global_enabled = False
 
         self.added_entities = []
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         await async_setup_entry(mock_hass, mock_entry, self.mock_async_add_entities)
 
@@ -463,6 +464,31 @@ class TestSwitchEntityKeys:
 
         assert "output_1_output" in output_switch_keys
 
+    @pytest.mark.asyncio
+    async def test_switch_output_name_and_icon(
+        self, mock_coordinator: Mock, mock_hass: Mock, mock_entry: Mock
+    ) -> None:
+        """Test that output switches are named after their output."""
+        mock_output = Mock()
+        mock_output.entity_info = Mock()
+        mock_output.entity_info.id = "output_1"
+        mock_output.entity_info.name = "Garage Siren"
+        mock_output.public_state = OutputPublicState.ON
+
+        mock_coordinator.data.outputs.get_items = Mock(return_value=[mock_output])
+        mock_coordinator.review_events_global_enabled = False
+
+        self.added_entities = []
+        mock_entry.runtime_data.coordinator = mock_coordinator
+
+        await async_setup_entry(mock_hass, mock_entry, self.mock_async_add_entities)
+
+        (output_switch,) = (
+            e for e in self.added_entities if isinstance(e, InceptionOutputSwitch)
+        )
+        assert output_switch.name == "Garage Siren"
+        assert output_switch.icon == "mdi:bullhorn"
+
     @pytest.mark.asyncio
     async def test_switch_input_isolated_keys(
         self, mock_coordinator: Mock, mock_hass: Mock, mock_entry: Mock
@@ -479,7 +505,7 @@ class TestSwitchEntityKeys:
         mock_coordinator.review_events_global_enabled = False
 
         self.added_entities = []
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         await async_setup_entry(mock_hass, mock_entry, self.mock_async_add_entities)
 
@@ -509,7 +535,7 @@ class TestSwitchEntityKeys:
         mock_coordinator.review_events_global_enabled = False
 
         self.added_entities = []
-        mock_hass.data = {"inception": {mock_entry.entry_id: mock_coordinator}}
+        mock_entry.runtime_data.coordinator = mock_coordinator
 
         await async_setup_entry(mock_hass, mock_entry, self.mock_async_add_entities)
 